@@ -30,6 +30,12 @@ std::string TriInd2str(CDT::TriInd it)
     return it != CDT::noNeighbor ? std::to_string(it) : "-";
 }
 
+// Docstring for Triangulation methods that release the GIL while CDT runs
+// (attached to one overload only to avoid repeating it in help())
+const char* const releasesGilDoc =
+    "All overloads release the GIL while running: the triangulation must not "
+    "be used from other threads until the call returns.";
+
 } // namespace
 
 PYBIND11_MODULE(PythonCDT, m)
@@ -189,6 +195,19 @@ PYBIND11_MODULE(PythonCDT, m)
                 return py::make_iterator(t.vertices.begin(), t.vertices.end());
             },
             py::keep_alive<0, 1>())
+        .def(
+            "vertices_array",
+            [](const Triangulation& t) {
+                // owning copy: stays valid when the triangulation changes
+                py::array_t<coord_t> arr({t.vertices.size(), std::size_t(2)});
+                auto out = arr.mutable_unchecked<2>();
+                for (py::ssize_t i = 0; i < out.shape(0); ++i)
+                {
+                    out(i, 0) = t.vertices[i].x;
+                    out(i, 1) = t.vertices[i].y;
+                }
+                return arr;
+            })
         // triangles
         .def_readonly("triangles", &Triangulation::triangles)
         .def(
@@ -201,6 +220,20 @@ PYBIND11_MODULE(PythonCDT, m)
                     t.triangles.begin(), t.triangles.end());
             },
             py::keep_alive<0, 1>())
+        .def(
+            "triangles_array",
+            [](const Triangulation& t) {
+                // owning copy: stays valid when the triangulation changes
+                py::array_t<CDT::VertInd> arr(
+                    {t.triangles.size(), std::size_t(3)});
+                auto out = arr.mutable_unchecked<2>();
+                for (py::ssize_t i = 0; i < out.shape(0); ++i)
+                {
+                    const CDT::VerticesArr3& vv = t.triangles[i].vertices;
+                    std::copy(vv.begin(), vv.end(), out.mutable_data(i, 0));
+                }
+                return arr;
+            })
         // fixed edges
         .def_readonly("fixed_edges", &Triangulation::fixedEdges)
         .def(
@@ -242,7 +275,9 @@ PYBIND11_MODULE(PythonCDT, m)
             "insert_vertices",
             static_cast<void (Triangulation::*)(const std::vector<V2d>&)>(
                 &Triangulation::insertVertices),
-            py::arg("vertices"))
+            py::arg("vertices"),
+            py::call_guard<py::gil_scoped_release>(),
+            releasesGilDoc)
         .def(
             "insert_vertices",
             [](Triangulation& t, py::buffer b) {
@@ -269,6 +304,7 @@ PYBIND11_MODULE(PythonCDT, m)
                 };
                 const std::size_t n_vert = info.size / 2;
                 const XY* const ptr = static_cast<XY*>(info.ptr);
+                const py::gil_scoped_release release;
                 t.insertVertices(
                     ptr,
                     ptr + n_vert,
@@ -280,7 +316,9 @@ PYBIND11_MODULE(PythonCDT, m)
             "insert_edges",
             static_cast<void (Triangulation::*)(const std::vector<CDT::Edge>&)>(
                 &Triangulation::insertEdges),
-            py::arg("edges"))
+            py::arg("edges"),
+            py::call_guard<py::gil_scoped_release>(),
+            releasesGilDoc)
         .def(
             "insert_edges",
             [](Triangulation& t, py::buffer b) {
@@ -308,6 +346,7 @@ PYBIND11_MODULE(PythonCDT, m)
                 };
                 const std::size_t n_vert = info.size / 2;
                 const EdgeData* const ptr = static_cast<EdgeData*>(info.ptr);
+                const py::gil_scoped_release release;
                 t.insertEdges(
                     ptr,
                     ptr + n_vert,
@@ -319,7 +358,9 @@ PYBIND11_MODULE(PythonCDT, m)
             "conform_to_edges",
             static_cast<void (Triangulation::*)(const std::vector<CDT::Edge>&)>(
                 &Triangulation::conformToEdges),
-            py::arg("edges"))
+            py::arg("edges"),
+            py::call_guard<py::gil_scoped_release>(),
+            releasesGilDoc)
         .def(
             "conform_to_edges",
             [](Triangulation& t, py::buffer b) {
@@ -347,6 +388,7 @@ PYBIND11_MODULE(PythonCDT, m)
                 };
                 const std::size_t n_vert = info.size / 2;
                 const EdgeData* const ptr = static_cast<EdgeData*>(info.ptr);
+                const py::gil_scoped_release release;
                 t.conformToEdges(
                     ptr,
                     ptr + n_vert,
@@ -8,8 +8,9 @@
 
 import numpy as np
 import pytest
-import tempfile
 import hashlib
+import io
+from concurrent.futures import ThreadPoolExecutor
 
 import PythonCDT as cdt
 
@@ -50,6 +51,8 @@ def test_Triangulation() -> None:
     assert len(t.vertices) == 0, "Wrong vertex count in empty triangulation"
     assert len(t.triangles) == 0, "Wrong triangle count in empty triangulation"
     assert len(t.fixed_edges) == 0, "Wrong fixed edge count in empty triangulation"
+    assert t.vertices_array().shape == (0, 2), "Wrong vertices array shape in empty triangulation"
+    assert t.triangles_array().shape == (0, 3), "Wrong triangles array shape in empty triangulation"
 
     vv = [cdt.V2d(-1, 0), cdt.V2d(0, 0.5), cdt.V2d(1, 0), cdt.V2d(0, -0.5)]
     t.insert_vertices(vv)
@@ -74,16 +77,13 @@ def test_Triangulation() -> None:
     assert t.fixed_edges_count() == len(t.fixed_edges), "Wrong fixed edge count"
     assert t.overlap_count_count() == len(t.overlap_count), "Wrong number of overlap-count"
     assert t.piece_to_originals_count() == len(t.piece_to_originals), "Wrong piece-to-originals count"
-    for i, v in enumerate(t.vertices_iter()):
-        assert v == t.vertices[i], "Wrong vertex from iterable"
-    for i, tri in enumerate(t.triangles_iter()):
-        assert tri == t.triangles[i], "Wrong triangle from iterable"
-    for fe in t.fixed_edges_iter():
-        assert fe in t.fixed_edges, "Wrong fixed edges from iterable"
-    for key, val in t.overlap_count_iter():
-        assert t.overlap_count[key] == val, "Wrong overlap-count from iterable"
-    for key, val in t.piece_to_originals_iter():
-        assert t.piece_to_originals[key] == val, "Wrong piece-to-originals from iterable"
+    assert np.array_equal(t.vertices_array(), [(v.x, v.y) for v in t.vertices]), "Wrong vertices array"
+    assert np.array_equal(t.triangles_array(), [tri.vertices for tri in t.triangles]), "Wrong triangles array"
+    assert list(t.vertices_iter()) == t.vertices, "Wrong vertices from iterable"
+    assert list(t.triangles_iter()) == t.triangles, "Wrong triangles from iterable"
+    assert set(t.fixed_edges_iter()) == t.fixed_edges, "Wrong fixed edges from iterable"
+    assert dict(t.overlap_count_iter()) == t.overlap_count, "Wrong overlap-count from iterable"
+    assert dict(t.piece_to_originals_iter()) == t.piece_to_originals, "Wrong piece-to-originals from iterable"
 
     #  Test resolving fixed edge intersections
     t = cdt.Triangulation(cdt.VertexInsertionOrder.AS_PROVIDED, cdt.IntersectingConstraintEdges.TRY_RESOLVE, 0.0)
@@ -103,85 +103,218 @@ def test_verify_topology() -> None:
     assert cdt.verify_topology(t), "Verifying topology produced wrong result"
 
 
-def save_triangulation_as_off(t: cdt.Triangulation, off_file) -> None:
-    with open(off_file, "w") as f:
-        f.write(f"OFF\n")
-        f.write(f"{t.vertices_count()} {t.triangles_count()} 0\n")
-        for v in t.vertices_iter():
-            f.write(f"{v.x} {v.y} 0\n")
-        for tri in t.triangles_iter():
-            vv = tri.vertices
-            f.write(f"3 {int(vv[0])} {int(vv[1])} {int(vv[2])}\n")
+def save_triangulation_as_off(t: cdt.Triangulation, out: io.TextIOBase) -> None:
+    vv = t.vertices_array()
+    tt = t.triangles_array()
+    # format all rows with a single %-operation: the formatting loop runs in C
+    out.writelines([f"OFF\n{len(vv)} {len(tt)} 0\n",
+                    ("%r %r 0\n" * len(vv)) % tuple(vv.ravel().tolist()),
+                    ("3 %d %d %d\n" * len(tt)) % tuple(tt.ravel().tolist())])
 
 
 def read_input_file(input_file):
     with open(input_file, "r") as f:
         n_verts, n_edges = (int(s) for s in f.readline().split())
-        verts = [cdt.V2d(*(float(s) for s in f.readline().split())) for _ in range(n_verts)]
-        edges = [cdt.Edge(*(int(s) for s in f.readline().split())) for _ in range(n_edges)]
-        return verts, edges
-
-def md5_checksum(file_path):
-    with open(file_path, 'r') as f:
-        return hashlib.md5(f.read().encode('utf-8')).hexdigest()
+        # vertex and edge lines both hold two numbers: parse them in one pass.
+        # Skipped when nothing is expected: loadtxt warns on an empty body and
+        # warnings are errors here (a truncated non-empty file still fails that way)
+        data = np.loadtxt(f, dtype=np.float64, ndmin=2) if n_verts + n_edges else np.empty((0, 2))
+    assert len(data) >= n_verts + n_edges, f"{input_file}: expected {n_verts} vertices and {n_edges} edges"
+    verts, edges = data[:n_verts], data[n_verts:n_verts + n_edges]
+    assert np.all((edges >= 0) & (edges < n_verts) & (edges == np.trunc(edges))), \
+        f"{input_file}: edge indices must be integers in [0, {n_verts})"
+    return verts, edges.astype(np.uintc)
+
+def _as_pairs(a: np.ndarray, what: str) -> np.ndarray:
+    """View flat input as (N, 2) pairs and reject any other shape"""
+    if a.ndim == 1:
+        a = a.reshape(-1, 2)
+    if a.ndim != 2 or a.shape[1] != 2:
+        raise ValueError(f"Expected (N, 2) {what} or a flat array of pairs, got shape {a.shape}")
+    return a
+
+def as_vertex_buffer(x) -> np.ndarray:
+    """C-contiguous (N, 2) float64 vertex buffer; copies only if dtype or layout differ"""
+    return _as_pairs(np.ascontiguousarray(x, dtype=np.float64), "vertex coordinates")
+
+def as_edge_buffer(x) -> np.ndarray:
+    """C-contiguous (M, 2) uintc edge buffer; copies only if dtype or layout differ"""
+    a = np.asarray(x)
+    if a.dtype != np.uintc and a.size and (np.any(a < 0) or np.any(a > np.iinfo(np.uintc).max)
+                                           or np.any(a != np.trunc(a))):
+        raise ValueError("Edge vertex indices must be non-negative integers fitting into uintc")
+    return _as_pairs(np.ascontiguousarray(a, dtype=np.uintc), "edge vertex indices")
+
+def triangulation_as_off(t: cdt.Triangulation) -> str:
+    off = io.StringIO()
+    save_triangulation_as_off(t, off)
+    return off.getvalue()
 
 def triangulation_md5_checksum(t: cdt.Triangulation):
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        off_file = f"{tmp_dir}/cdt.off"
-        save_triangulation_as_off(t, off_file)
-        return md5_checksum(off_file)
+    return hashlib.md5(triangulation_as_off(t).encode("utf-8")).hexdigest()
+
 
-def test_triangulate_input_file() -> None:
-    vv, ee = read_input_file("CDT/visualizer/data/Constrained Sweden.txt")
+@pytest.fixture(scope="module",
+                params=[("CDT/visualizer/data/Constrained Sweden.txt", "insert_edges", '5fb163a9f27ec6bdd05b7d5f2b23416c'),
+                        ("CDT/visualizer/data/ditch.txt", "conform_to_edges", 'df2503c614e2f98656038948b355b27e')],
+                ids=["sweden", "ditch"])
+def input_file_triangulation(request):
+    """Triangulation of an input file built once per module, paired with the expected OFF checksum"""
+    input_file, add_edges, off_md5 = request.param
+    vv, ee = read_input_file(input_file)
     t = cdt.Triangulation(cdt.VertexInsertionOrder.AS_PROVIDED, cdt.IntersectingConstraintEdges.TRY_RESOLVE, 0.0)
     t.insert_vertices(vv)
-    t.insert_edges(ee)
+    getattr(t, add_edges)(ee)
     t.erase_outer_triangles_and_holes()
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        off_file = f"{tmp_dir}/cdt.off"
-        save_triangulation_as_off(t, off_file)
-        assert md5_checksum(off_file) == '5fb163a9f27ec6bdd05b7d5f2b23416c', "Wrong OFF file contents"
+    return t, off_md5
 
 
-def test_conform_to_edges() -> None:
-    vv, ee = read_input_file("CDT/visualizer/data/ditch.txt")
-    t = cdt.Triangulation(cdt.VertexInsertionOrder.AS_PROVIDED, cdt.IntersectingConstraintEdges.TRY_RESOLVE, 0.0)
-    t.insert_vertices(vv)
-    t.conform_to_edges(ee)
-    t.erase_outer_triangles_and_holes()
-    assert triangulation_md5_checksum(t) == 'df2503c614e2f98656038948b355b27e', "Wrong OFF file contents"
+def test_triangulate_input_file(input_file_triangulation) -> None:
+    t, off_md5 = input_file_triangulation
+    assert triangulation_md5_checksum(t) == off_md5, "Wrong OFF file contents"
+
+
+def test_input_file_topology(input_file_triangulation) -> None:
+    t, _ = input_file_triangulation
+    assert cdt.verify_topology(t), "Verifying topology produced wrong result"
+
+
+@pytest.fixture(scope="module")
+def insert_vertices_off() -> str:
+    """OFF output of triangulating the reference vertices, computed once per module"""
+    t = cdt.Triangulation(cdt.VertexInsertionOrder.AS_PROVIDED, cdt.IntersectingConstraintEdges.NOT_ALLOWED, 0.0)
+    t.insert_vertices([cdt.V2d(-1, 0), cdt.V2d(0, 0.5), cdt.V2d(1, 0), cdt.V2d(0, -0.5)])
+    return triangulation_as_off(t)
+
+
+def test_insert_vertices_off(insert_vertices_off) -> None:
+    off_md5 = hashlib.md5(insert_vertices_off.encode("utf-8")).hexdigest()
+    assert off_md5 == 'c424c4f2691dc3b9aabd39dcf2e17c53', "Wrong OFF file contents"
 
 
 @pytest.mark.parametrize("vv", [[cdt.V2d(-1, 0), cdt.V2d(0, 0.5), cdt.V2d(1, 0), cdt.V2d(0, -0.5)],
                                 np.array([[-1, 0], [0, 0.5], [1, 0], [0, -0.5]], dtype=np.float64),
                                 np.array([-1, 0, 0, 0.5, 1, 0, 0, -0.5], dtype=np.float64)])
-def test_insert_vertices(vv) -> None:
+def test_insert_vertices(vv, insert_vertices_off) -> None:
     t = cdt.Triangulation(cdt.VertexInsertionOrder.AS_PROVIDED, cdt.IntersectingConstraintEdges.NOT_ALLOWED, 0.0)
     t.insert_vertices(vv)
     assert len(t.vertices) == 7, "Wrong vertex count in triangulation"
     assert len(t.triangles) == 9, "Wrong triangle count in triangulation"
     assert len(t.fixed_edges) == 0, "Wrong fixed edge count in triangulation"
-    assert triangulation_md5_checksum(t) == 'c424c4f2691dc3b9aabd39dcf2e17c53', "Wrong OFF file contents"
+    assert triangulation_as_off(t) == insert_vertices_off, "Wrong OFF file contents"
+
+
+def test_buffer_helpers() -> None:
+    """Test that vertex and edge buffer helpers do not copy compatible arrays"""
+    vv = np.array([-1, 0, 0, 0.5, 1, 0, 0, -0.5], dtype=np.float64)
+    assert as_vertex_buffer(vv).shape == (4, 2), "Wrong vertex buffer shape"
+    assert np.shares_memory(as_vertex_buffer(vv), vv), "Vertex buffer was copied"
+    ee = np.array([[0, 1], [2, 3]], dtype=np.uintc)
+    assert np.shares_memory(as_edge_buffer(ee), ee), "Edge buffer was copied"
+    assert as_edge_buffer(ee[:, ::-1]).flags.c_contiguous, "Edge buffer is not contiguous"
+    assert np.array_equal(as_edge_buffer(ee[:, ::-1]), ee[:, ::-1]), "Wrong edge buffer values"
+
+
+def test_buffer_helpers_reject_bad_input() -> None:
+    """Test that vertex and edge buffer helpers reject input they cannot convert faithfully"""
+    with pytest.raises(ValueError):
+        as_vertex_buffer(np.arange(12.).reshape(4, 3))
+    with pytest.raises(ValueError):
+        as_edge_buffer(np.arange(12).reshape(4, 3))
+    with pytest.raises(ValueError):
+        as_edge_buffer(np.array([[-1, 2]]))
+    with pytest.raises(ValueError):
+        as_edge_buffer(np.array([[0.5, 2]]))
+
+
+@pytest.mark.parametrize("vv", [[(-1, 0), (0, 0.5), (1, 0), (0, -0.5)],
+                                np.array([[-1, 0], [0, 0.5], [1, 0], [0, -0.5]], dtype=np.float32),
+                                np.array([[-1, 0, 9], [0, 0.5, 9], [1, 0, 9], [0, -0.5, 9]])[:, :2]])
+def test_insert_vertex_buffer(vv, insert_vertices_off) -> None:
+    t = cdt.Triangulation(cdt.VertexInsertionOrder.AS_PROVIDED, cdt.IntersectingConstraintEdges.NOT_ALLOWED, 0.0)
+    t.insert_vertices(as_vertex_buffer(vv))
+    assert triangulation_as_off(t) == insert_vertices_off, "Wrong OFF file contents"
+
+
+# reference input shared by the edge insertion and conforming tests
+EDGES_TEST_VERTICES = [(0, 0), (4, 0), (5, 1), (2, 1), (-1, 1), (0, 2), (4, 2)]
+EDGES_TEST_EDGES = [(0, 1), (2, 3), (3, 4), (5, 6)]
+
+
+@pytest.fixture(scope="module")
+def insert_conform_edges_off():
+    """OFF outputs of inserting and of conforming to the reference edges, computed once per module"""
+    ee = [cdt.Edge(*e) for e in EDGES_TEST_EDGES]
+    offs = []
+    for add_edges in ("insert_edges", "conform_to_edges"):
+        t = cdt.Triangulation(cdt.VertexInsertionOrder.AS_PROVIDED, cdt.IntersectingConstraintEdges.NOT_ALLOWED, 0.0)
+        t.insert_vertices(np.array(EDGES_TEST_VERTICES, dtype=float))
+        getattr(t, add_edges)(ee)
+        offs.append(triangulation_as_off(t))
+    return tuple(offs)
+
+
+def test_insert_conform_edges_off(insert_conform_edges_off) -> None:
+    insert_off, conform_off = insert_conform_edges_off
+    assert hashlib.md5(insert_off.encode("utf-8")).hexdigest() == '8424ba2c8f8ebabe1bea4141464a347b', \
+        "Wrong OFF file contents after inserting edges"
+    assert hashlib.md5(conform_off.encode("utf-8")).hexdigest() == '9cb9dbaca4943ff0e3aab6c1d31f5a35', \
+        "Wrong OFF file contents after conforming to edges"
 
 
-@pytest.mark.parametrize("ee", [[cdt.Edge(0, 1), cdt.Edge(2, 3), cdt.Edge(3, 4), cdt.Edge(5, 6)],
-                                np.array([[0, 1], [2, 3], [3, 4], [5, 6]], dtype=np.uintc),
-                                np.array([0, 1, 2, 3, 3, 4, 5, 6], dtype=np.uintc)])
-def test_insert_conform_edges(ee) -> None:
+@pytest.mark.parametrize("ee", [[cdt.Edge(*e) for e in EDGES_TEST_EDGES],
+                                np.array(EDGES_TEST_EDGES, dtype=np.uintc),
+                                np.array(EDGES_TEST_EDGES, dtype=np.uintc).ravel()])
+def test_insert_conform_edges(ee, insert_conform_edges_off) -> None:
+    insert_off, conform_off = insert_conform_edges_off
     # insert edges
     t = cdt.Triangulation(cdt.VertexInsertionOrder.AS_PROVIDED, cdt.IntersectingConstraintEdges.NOT_ALLOWED, 0.0)
-    t.insert_vertices(np.array([[0, 0], [4, 0], [5, 1], [2, 1], [-1, 1], [0, 2], [4, 2]], dtype=float))
+    t.insert_vertices(np.array(EDGES_TEST_VERTICES, dtype=float))
     t.insert_edges(ee)
     assert len(t.vertices) == 10, "Wrong vertex count in triangulation"
     assert len(t.triangles) == 15, "Wrong triangle count in triangulation"
     assert len(t.fixed_edges) == 4, "Wrong fixed edge count in triangulation"
-    assert triangulation_md5_checksum(t) == '8424ba2c8f8ebabe1bea4141464a347b', "Wrong OFF file contents"
+    assert triangulation_as_off(t) == insert_off, "Wrong OFF file contents after inserting edges"
 
     # conform to edges
     t = cdt.Triangulation(cdt.VertexInsertionOrder.AS_PROVIDED, cdt.IntersectingConstraintEdges.NOT_ALLOWED, 0.0)
-    t.insert_vertices(np.array([[0, 0], [4, 0], [5, 1], [2, 1], [-1, 1], [0, 2], [4, 2]], dtype=float))
+    t.insert_vertices(np.array(EDGES_TEST_VERTICES, dtype=float))
     t.conform_to_edges(ee)
     assert len(t.vertices) == 12, "Wrong vertex count in triangulation"
     assert len(t.triangles) == 19, "Wrong triangle count in triangulation"
     assert len(t.fixed_edges) == 6, "Wrong fixed edge count in triangulation"
-    assert triangulation_md5_checksum(t) == '9cb9dbaca4943ff0e3aab6c1d31f5a35', "Wrong OFF file contents"
+    assert triangulation_as_off(t) == conform_off, "Wrong OFF file contents after conforming to edges"
+
+
+@pytest.mark.parametrize("ee", [EDGES_TEST_EDGES,
+                                np.array([[0, 1, 9], [2, 3, 9], [3, 4, 9], [5, 6, 9]])[:, :2]])
+def test_insert_edge_buffer(ee, insert_conform_edges_off) -> None:
+    insert_off, conform_off = insert_conform_edges_off
+    vv = as_vertex_buffer(EDGES_TEST_VERTICES)
+    t = cdt.Triangulation(cdt.VertexInsertionOrder.AS_PROVIDED, cdt.IntersectingConstraintEdges.NOT_ALLOWED, 0.0)
+    t.insert_vertices(vv)
+    t.insert_edges(as_edge_buffer(ee))
+    assert triangulation_as_off(t) == insert_off, "Wrong OFF file contents after inserting edges"
+
+    t = cdt.Triangulation(cdt.VertexInsertionOrder.AS_PROVIDED, cdt.IntersectingConstraintEdges.NOT_ALLOWED, 0.0)
+    t.insert_vertices(vv)
+    t.conform_to_edges(as_edge_buffer(ee))
+    assert triangulation_as_off(t) == conform_off, "Wrong OFF file contents after conforming to edges"
+
+
+def test_separate_triangulations_in_threads(insert_conform_edges_off) -> None:
+    """Smoke test: separate triangulations built from several threads give the reference results"""
+    def triangulate(args):
+        add_edges, ee = args
+        t = cdt.Triangulation(cdt.VertexInsertionOrder.AS_PROVIDED, cdt.IntersectingConstraintEdges.NOT_ALLOWED, 0.0)
+        t.insert_vertices(np.array(EDGES_TEST_VERTICES, dtype=float))
+        getattr(t, add_edges)(ee)
+        return triangulation_as_off(t)
+
+    edge_inputs = [[cdt.Edge(*e) for e in EDGES_TEST_EDGES], np.array(EDGES_TEST_EDGES, dtype=np.uintc)]
+    jobs = [(add_edges, ee) for add_edges in ("insert_edges", "conform_to_edges") for ee in edge_inputs] * 4
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        offs = list(pool.map(triangulate, jobs))
+    insert_off, conform_off = insert_conform_edges_off
+    expected = [insert_off if add_edges == "insert_edges" else conform_off for add_edges, _ in jobs]
+    assert offs == expected, "Wrong OFF file contents from threaded triangulation"
@@ -135,6 +135,6 @@ setup(
     ext_modules=[CMakeExtension("PythonCDT")],
     cmdclass={"build_ext": CMakeBuild},
     zip_safe=False,
-    extras_require={"test": ["pytest>=6.0"]},
+    extras_require={"test": ["pytest>=6.0", "pytest-xdist"]},
     python_requires=">=3.6",
 )